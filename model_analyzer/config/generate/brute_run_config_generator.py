@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Generator, Optional, Dict
+from typing import List, Generator, Iterator, Optional, Dict
 
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 
@@ -67,9 +67,6 @@ def __init__(self,
 
         self._num_models = len(models)
 
-        self._curr_model_run_configs: List[Optional[ModelRunConfig]] = [
-            None for n in range(self._num_models)
-        ]
         self._curr_results: List = [[] for n in range(self._num_models)]
         self._curr_generators: Dict[int, ConfigGeneratorInterface] = {}
 
@@ -91,18 +88,63 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
         yield from self._get_next_config()
 
     def _get_next_config(self) -> Generator[RunConfig, None, None]:
+        # The model config generators never return the default config when
+        # default_only is False, so the two steps below generate disjoint
+        # sets of RunConfigs and no default combination is measured twice
         if not self._skip_default_config:
-            yield from self._generate_subset(0, default_only=True)
+            yield from self._generate_subset(default_only=True)
 
         if self._should_generate_non_default_configs():
-            yield from self._generate_subset(0, default_only=False)
+            yield from self._generate_subset(default_only=False)
 
     def _should_generate_non_default_configs(self) -> bool:
         return self._config.triton_launch_mode != 'remote'
 
     def _generate_subset(
-            self, index: int,
-            default_only: bool) -> Generator[RunConfig, None, None]:
+            self, default_only: bool) -> Generator[RunConfig, None, None]:
+        """
+        Walks the combinations of all models' ModelRunConfigs as an odometer,
+        where the last model is the fastest moving digit
+
+        When a model runs out of ModelRunConfigs, its results are flushed and
+        the previous model is stepped. Every model after a stepped model gets
+        a fresh generator, since those generators make their decisions based
+        on the measurements of the current combination
+
+        For the same reason the generators are only advanced after the
+        results of their last config have been sent to them, and their
+        configs can't be prefetched ahead of the measurements
+        """
+        config_iterators: Dict[int, Iterator[ModelRunConfig]] = {}
+        model_run_configs: List[Optional[ModelRunConfig]] = [
+            None for n in range(self._num_models)
+        ]
+
+        index = 0
+        config_iterators[index] = self._create_generator_iterator(
+            index, default_only)
+
+        while index >= 0:
+            model_run_config = next(config_iterators[index], None)
+
+            if model_run_config is None:
+                index -= 1
+                if index >= 0:
+                    self._send_results_to_generator(index)
+                continue
+
+            model_run_configs[index] = model_run_config
+
+            if index == self._num_models - 1:
+                yield (self._make_run_config(model_run_configs))
+                self._send_results_to_generator(index)
+            else:
+                index += 1
+                config_iterators[index] = self._create_generator_iterator(
+                    index, default_only)
+
+    def _create_generator_iterator(
+            self, index: int, default_only: bool) -> Iterator[ModelRunConfig]:
         mrcg = ModelRunConfigGenerator(self._config, self._gpus,
                                        self._models[index], self._client,
                                        self._model_variant_name_manager,
@@ -110,21 +152,13 @@ def _generate_subset(
 
         self._curr_generators[index] = mrcg
 
-        for model_run_config in mrcg.get_configs():
-            self._curr_model_run_configs[index] = model_run_config
-
-            if index == (len(self._models) - 1):
-                yield (self._make_run_config())
-            else:
-                yield from self._generate_subset(index + 1, default_only)
-
-            self._send_results_to_generator(index)
+        return mrcg.get_configs()
 
-    def _make_run_config(self) -> RunConfig:
-        run_config = RunConfig(self._triton_env)
-        for index in range(len(self._models)):
-            run_config.add_model_run_config(self._curr_model_run_configs[index])
-        return run_config
+    def _make_run_config(
+            self,
+            model_run_configs: List[Optional[ModelRunConfig]]) -> RunConfig:
+        return RunConfig.from_model_run_configs(self._triton_env,
+                                                model_run_configs)
 
     def _send_results_to_generator(self, index: int) -> None:
         self._curr_generators[index].set_last_results(self._curr_results[index])
@@ -138,7 +172,7 @@ def determine_triton_server_env(cls,
         """
         triton_env = models[0].triton_server_environment()
 
-        for model in models:
+        for model in models[1:]:
             if model.triton_server_environment() != triton_env:
                 raise TritonModelAnalyzerException(
                     f"Mismatching triton server environments. The triton server environment must be the same for all models when run concurrently"
@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-from typing import Iterator, Any, Union, List
+from typing import Iterator, Any, Union, List, Tuple, Optional
 
 
 class Coordinate:
@@ -21,6 +20,8 @@ class Coordinate:
     Class to define a coordinate in n-dimension space
     """
 
+    __slots__ = ('_values', '_key')
+
     def __init__(self, val: Union['Coordinate', List[int]]):
         """
         val: list
@@ -29,13 +30,24 @@ def __init__(self, val: Union['Coordinate', List[int]]):
         if isinstance(val, Coordinate):
             val = val._values
 
-        self._values: List[int] = deepcopy(val)
+        self._values: List[int] = list(val)
+        self._key: Optional[Tuple[int, ...]] = None
+
+    def key(self) -> Tuple[int, ...]:
+        """
+        Returns a hashable tuple of the values, which is
+        cached until the coordinate is modified
+        """
+        if self._key is None:
+            self._key = tuple(self._values)
+        return self._key
 
     def __getitem__(self, idx: int) -> int:
         return self._values[idx]
 
     def __setitem__(self, idx: int, item: int) -> None:
         self._values[idx] = item
+        self._key = None
 
     def __len__(self) -> int:
         return len(self._values)
@@ -69,15 +81,22 @@ def __mul__(self, other: Any) -> 'Coordinate':
             raise Exception("Unhandled mul type")
 
     def __eq__(self, other: Any) -> bool:
+        if type(other) is Coordinate:
+            return self.key() == other.key()
+
         for i, v in enumerate(self._values):
             if v != other[i]:
                 return False
         return True
 
+    def __hash__(self) -> int:
+        return hash(self.key())
+
     def round(self) -> None:
         """ Rounds the coordinate in-place """
         for i, _ in enumerate(self._values):
             self._values[i] = round(self._values[i])
+        self._key = None
 
     def _add_coordinate(self, other: Any) -> 'Coordinate':
         ret = Coordinate(self._values)
@@ -116,15 +135,7 @@ def _div_number(self, other: Any) -> 'Coordinate':
         return ret
 
     def __iter__(self) -> Iterator:
-        self._idx = 0
-        return self
-
-    def __next__(self) -> int:
-        if self._idx < len(self._values):
-            val = self._values[self._idx]
-            self._idx += 1
-            return val
-        raise StopIteration
+        return iter(self._values)
 
     def __str__(self) -> str:
         return str(self._values)
@@ -16,7 +16,7 @@
 from model_analyzer.config.generate.coordinate import Coordinate
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
-CoordinateKey = Tuple[Coordinate, ...]
+CoordinateKey = Tuple[int, ...]
 
 
 class CoordinateData:
@@ -36,7 +36,7 @@ def get_measurement(
         """
         Return the measurement data of the given coordinate.
         """
-        key: CoordinateKey = tuple(coordinate)
+        key: CoordinateKey = coordinate.key()
         return self._measurements.get(key, None)
 
     def set_measurement(self, coordinate: Coordinate,
@@ -44,7 +44,7 @@ def set_measurement(self, coordinate: Coordinate,
         """
         Set the measurement for the given coordinate.
         """
-        key: CoordinateKey = tuple(coordinate)
+        key: CoordinateKey = coordinate.key()
         self._measurements[key] = measurement
         self._is_measured[key] = True
 
@@ -52,7 +52,7 @@ def is_measured(self, coordinate: Coordinate) -> bool:
         """
         Returns true if a measurement has been set for the given Coordinate
         """
-        key: CoordinateKey = tuple(coordinate)
+        key: CoordinateKey = coordinate.key()
         return self._is_measured.get(key, False)
 
     def has_valid_measurement(self, coordinate: Coordinate) -> bool:
@@ -72,13 +72,12 @@ def get_visit_count(self, coordinate: Coordinate) -> int:
         Get the visit count for the given coordinate. 
         Returns 0 if the coordinate hasn't been visited yet
         """
-        key: CoordinateKey = tuple(coordinate)
+        key: CoordinateKey = coordinate.key()
         return self._visit_counts.get(key, 0)
 
     def increment_visit_count(self, coordinate: Coordinate) -> None:
         """
         Increase the visit count for the given coordinate by 1
         """
-        key: CoordinateKey = tuple(coordinate)
-        new_count = self.get_visit_count(coordinate) + 1
-        self._visit_counts[key] = new_count
+        key: CoordinateKey = coordinate.key()
+        self._visit_counts[key] = self._visit_counts.get(key, 0) + 1
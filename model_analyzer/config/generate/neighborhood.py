@@ -13,9 +13,10 @@
 # limitations under the License.
 
 import math
-from itertools import product
 from copy import deepcopy
 
+import numpy as np
+
 from typing import List, Tuple, Dict, Optional
 
 from model_analyzer.config.generate.coordinate import Coordinate
@@ -58,7 +59,10 @@ def __init__(self, neighborhood_config: NeighborhoodConfig,
         self._coordinate_data = coordinate_data
 
         self._radius = self._config.get_radius()
-        self._neighborhood = self._create_neighborhood()
+        self._neighborhood_values = self._create_neighborhood_values()
+        self._neighborhood = [
+            Coordinate(x) for x in self._neighborhood_values.tolist()
+        ]
 
         self._force_slow_mode = False
 
@@ -98,6 +102,12 @@ def force_slow_mode(self) -> None:
         """
         self._force_slow_mode = True
 
+    def clear_force_slow_mode(self) -> None:
+        """
+        When called, stops forcing the neighborhood into slow mode
+        """
+        self._force_slow_mode = False
+
     def determine_new_home(self) -> Coordinate:
         """
         Based on the measurements in the neighborhood, determine where
@@ -202,37 +212,34 @@ def get_nearest_neighbor(self, coordinate_in: Coordinate) -> Coordinate:
         Find the nearest coordinate to the `coordinate_in` among the
         coordinates within the current neighborhood.
         """
-        min_distance = float('inf')
-        nearest_neighbor = self._home_coordinate
+        distances = self._calc_distances(self._neighborhood_values,
+                                         coordinate_in)
+        return self._neighborhood[int(np.argmin(distances))]
 
-        for coordinate in self._neighborhood:
-            distance = Neighborhood.calc_distance(coordinate, coordinate_in)
-            if distance < min_distance:
-                nearest_neighbor = coordinate
-                min_distance = distance
-
-        return nearest_neighbor
-
-    def _create_neighborhood(self) -> List[Coordinate]:
-
-        neighborhood = []
-        potential_neighborhood = self._get_potential_neighborhood(
+    def _create_neighborhood_values(self) -> np.ndarray:
+        """
+        Returns an array, with one row per coordinate, of all
+        coordinates within the radius of the home coordinate
+        """
+        potential_values = self._get_potential_neighborhood_values(
             self._home_coordinate, self._radius)
+        distances = self._calc_distances(potential_values,
+                                         self._home_coordinate)
 
-        for potential_coordinate in potential_neighborhood:
-            distance = Neighborhood.calc_distance(self._home_coordinate,
-                                                  potential_coordinate)
-
-            if distance <= self._radius:
-                neighborhood.append(potential_coordinate)
+        return potential_values[distances <= self._radius]
 
-        return neighborhood
-
-    def _get_potential_neighborhood(self, coordinate: Coordinate,
-                                    radius: int) -> List[Coordinate]:
+    def _get_potential_neighborhood_values(self, coordinate: Coordinate,
+                                           radius: int) -> np.ndarray:
         bounds = self._get_bounds(coordinate, radius)
-        potential_values = self._enumerate_all_values_in_bounds(bounds)
-        return [Coordinate(x) for x in potential_values]
+        return self._enumerate_all_values_in_bounds(bounds)
+
+    def _calc_distances(self, values: np.ndarray,
+                        coordinate: Coordinate) -> np.ndarray:
+        """
+        Return the euclidean distance between each row of values
+        and the coordinate
+        """
+        return np.linalg.norm(values - np.array(list(coordinate)), axis=1)
 
     def _get_bounds(self, coordinate: Coordinate,
                     radius: int) -> List[List[int]]:
@@ -247,15 +254,21 @@ def _get_bounds(self, coordinate: Coordinate,
             bounds.append([lower_bound, upper_bound])
         return bounds
 
-    def _enumerate_all_values_in_bounds(
-            self, bounds: List[List[int]]) -> List[List[int]]:
-        possible_index_values = []
-        for bound in bounds:
-            low: int = bound[0]
-            high: int = bound[1]
-            possible_index_values.append(list(range(low, high + 1)))
-        tuples = list(product(*possible_index_values))
-        return [list(x) for x in tuples]
+    def _enumerate_all_values_in_bounds(self,
+                                        bounds: List[List[int]]) -> np.ndarray:
+        """
+        Returns an array, with one row per coordinate, of all coordinates
+        inside of the (inclusive) bounds. The rows are in the same order
+        that itertools.product would enumerate them
+        """
+        lows = np.array([bound[0] for bound in bounds], dtype=np.int64)
+        shape = [bound[1] - bound[0] + 1 for bound in bounds]
+
+        num_values = int(np.prod(shape, dtype=np.int64))
+
+        offsets = np.indices(shape,
+                             dtype=np.int64).reshape(len(bounds), num_values).T
+        return offsets + lows
 
     def _get_coordinates_with_valid_measurements(self) -> List[Coordinate]:
         initialized_coordinates = []
@@ -312,28 +325,23 @@ def _calculate_step_vector_from_measurements(
     def _calculate_step_vector_from_vectors_and_weights(
             self, vectors: List[Coordinate],
             weights: List[float]) -> List[float]:
-        step_vector = [0.0] * self._config.get_num_dimensions()
-        dim_sum_vector = [0.0] * self._config.get_num_dimensions()
-
         # For each dimension -
         #   if non zero, add weight (inverting if dimension is negative)
         #   divide by sum of coordinate of that dimension
-        for vector, weight in zip(vectors, weights):
-
-            for dim, v in enumerate(vector):
-                if v:
-                    if v > 0:
-                        step_vector[dim] += weight
-                        dim_sum_vector[dim] += v
-                    else:
-                        step_vector[dim] -= weight
-                        dim_sum_vector[dim] -= v
-
-        for dim, v in enumerate(dim_sum_vector):
-            if v:
-                step_vector[dim] /= v
-
-        return step_vector
+        vector_values = np.array([list(vector) for vector in vectors],
+                                 dtype=np.float64)
+        weight_values = np.array(weights, dtype=np.float64)
+
+        step_vector = (np.sign(vector_values) *
+                       weight_values[:, np.newaxis]).sum(axis=0)
+        dim_sum_vector = np.abs(vector_values).sum(axis=0)
+
+        np.divide(step_vector,
+                  dim_sum_vector,
+                  out=step_vector,
+                  where=dim_sum_vector != 0)
+
+        return step_vector.tolist()
 
     def _get_all_measurements(
             self) -> Tuple[List[Coordinate], List[RunConfigMeasurement]]:
@@ -19,7 +19,7 @@
 from model_analyzer.config.generate.base_model_config_generator import BaseModelConfigGenerator
 from model_analyzer.config.generate.search_config import SearchConfig
 from model_analyzer.config.generate.coordinate import Coordinate
-from model_analyzer.config.generate.coordinate_data import CoordinateData
+from model_analyzer.config.generate.coordinate_data import CoordinateData, CoordinateKey
 from model_analyzer.config.generate.neighborhood import Neighborhood
 from model_analyzer.config.generate.brute_run_config_generator import BruteRunConfigGenerator
 from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
@@ -34,6 +34,7 @@
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 from sys import maxsize
+from copy import copy
 
 from model_analyzer.constants import LOGGER_NAME
 
@@ -80,6 +81,15 @@ def __init__(self, search_config: SearchConfig,
         self._triton_env = BruteRunConfigGenerator.determine_triton_server_env(
             models)
 
+        # Which of the search bounds were set by the user can't change while
+        # generating, so look them up once instead of for every new config
+        self._search_bounds_set_by_config = self._get_search_bounds_set_by_config(
+        )
+
+        # The parts of each model's PerfAnalyzerConfig that don't change
+        # between steps are built once and copied for every new config
+        self._perf_analyzer_config_templates: Dict[str, PerfAnalyzerConfig] = {}
+
         # This tracks measured results for all coordinates
         self._coordinate_data = CoordinateData()
 
@@ -96,9 +106,12 @@ def __init__(self, search_config: SearchConfig,
         self._best_coordinate = self._home_coordinate
         self._best_measurement: Optional[RunConfigMeasurement] = None
 
-        self._neighborhood = Neighborhood(
-            self._search_config.get_neighborhood_config(),
-            self._home_coordinate, self._coordinate_data)
+        # Neighborhoods are cached by their home coordinate. Each one holds
+        # a reference to self._coordinate_data, so a cached neighborhood
+        # always sees the latest measurements and visit counts
+        self._neighborhoods: Dict[CoordinateKey, Neighborhood] = {}
+
+        self._neighborhood = self._get_neighborhood(self._home_coordinate)
 
         # Sticky bit. Once true, we should never stay at a home that is failing or None
         self._home_has_passed = False
@@ -198,6 +211,11 @@ def _take_step(self) -> None:
         new_coordinate = self._neighborhood.determine_new_home()
         self._determine_if_done(new_coordinate)
 
+        # No more configs will be generated, so there is
+        # no need to build the neighborhood at the new home
+        if self._is_done():
+            return
+
         logger.debug(f"Stepping {self._home_coordinate}->{new_coordinate}")
         self._home_coordinate = new_coordinate
         self._coordinate_to_measure = new_coordinate
@@ -210,6 +228,7 @@ def _take_step_back(self) -> None:
         # TODO: TMA-871: handle back-off (and its termination) better.
         if new_coordinate == self._home_coordinate:
             self._done = True
+            return
 
         logger.debug(
             f"Stepping back: {self._home_coordinate}->{new_coordinate}")
@@ -246,16 +265,27 @@ def _determine_if_done(self, new_coordinate: Coordinate) -> None:
             self._done = True
 
     def _recreate_neighborhood(self, force_slow_mode: bool) -> None:
-        neighborhood_config = self._search_config.get_neighborhood_config()
-
-        self._neighborhood = Neighborhood(neighborhood_config,
-                                          self._home_coordinate,
-                                          self._coordinate_data)
+        self._neighborhood = self._get_neighborhood(self._home_coordinate)
 
         self._coordinate_data.increment_visit_count(self._home_coordinate)
 
         if force_slow_mode:
             self._neighborhood.force_slow_mode()
+        else:
+            self._neighborhood.clear_force_slow_mode()
+
+    def _get_neighborhood(self, home_coordinate: Coordinate) -> Neighborhood:
+        """
+        Returns the neighborhood around home_coordinate, only creating
+        it if it hasn't been created before
+        """
+        key: CoordinateKey = home_coordinate.key()
+        if key not in self._neighborhoods:
+            self._neighborhoods[key] = Neighborhood(
+                self._search_config.get_neighborhood_config(), home_coordinate,
+                self._coordinate_data)
+
+        return self._neighborhoods[key]
 
     def _pick_coordinate_to_initialize(self) -> None:
         next_coordinate = self._neighborhood.pick_coordinate_to_initialize()
@@ -272,46 +302,54 @@ def _get_starting_coordinate(self) -> Coordinate:
         min_indexes = self._search_config.get_min_indexes()
         return Coordinate(min_indexes)
 
-    def _get_coordinate_values(self, coordinate: Coordinate,
-                               key: int) -> Dict[str, Union[int, float]]:
+    def _get_coordinate_values(
+            self,
+            coordinate: Coordinate) -> Dict[int, Dict[str, Union[int, float]]]:
         dims = self._search_config.get_dimensions()
-        values = dims.get_values_for_coordinate(coordinate)
-        return values[key]
+        return dims.get_values_for_coordinate(coordinate)
 
     def _get_next_run_config(self) -> RunConfig:
-        run_config = RunConfig(self._triton_env)
+        model_run_configs = []
+
+        # The values of every model are looked up once per coordinate
+        # and then shared by all of the model and perf analyzer configs
+        dimension_values = self._get_coordinate_values(
+            self._coordinate_to_measure)
 
         model_index = 0
         for model in self._models:
             mrc, model_index = self._get_next_model_run_config(
-                model, model_index)
-            run_config.add_model_run_config(mrc)
+                model, model_index, dimension_values)
+            model_run_configs.append(mrc)
 
-        return run_config
+        return RunConfig.from_model_run_configs(self._triton_env,
+                                                model_run_configs)
 
     def _get_next_model_run_config(
-            self, model: ModelProfileSpec,
-            model_index: int) -> Tuple[ModelRunConfig, int]:
+        self, model: ModelProfileSpec, model_index: int,
+        dimension_values: Dict[int, Dict[str, Union[int, float]]]
+    ) -> Tuple[ModelRunConfig, int]:
         start_model_index = model_index
 
         if model.model_name() in self._ensemble_submodels:
             ensemble_subconfigs, end_model_index = self._get_next_ensemble_subconfigs(
-                model, start_model_index)
+                model, start_model_index, dimension_values)
 
             param_combo = self._get_next_ensemble_param_combo(
-                start_model_index, end_model_index)
+                start_model_index, end_model_index, dimension_values)
 
             model_config = self._get_next_ensemble_model_config(
                 model, ensemble_subconfigs, param_combo)
 
             model_index = end_model_index
         else:
-            model_config = self._get_next_model_config(model, model_index)
+            model_config = self._get_next_model_config(
+                model, dimension_values[model_index])
             model_index = model_index + 1
 
         model_variant_name = model_config.get_field('name')
         perf_analyzer_config = self._get_next_perf_analyzer_config(
-            model_variant_name, model, start_model_index)
+            model_variant_name, model, dimension_values[start_model_index])
 
         model_name = model.model_name()
         model_run_config = ModelRunConfig(model_name, model_config,
@@ -323,19 +361,22 @@ def _get_next_model_run_config(
         return (model_run_config, model_index)
 
     def _get_next_ensemble_subconfigs(
-            self, model: ModelProfileSpec,
-            start_model_index: int) -> Tuple[List[ModelConfig], int]:
+        self, model: ModelProfileSpec, start_model_index: int,
+        dimension_values: Dict[int, Dict[str, Union[int, float]]]
+    ) -> Tuple[List[ModelConfig], int]:
         model_index = start_model_index
         ensemble_subconfigs = []
         for ensemble_submodel in self._ensemble_submodels[model.model_name()]:
             ensemble_subconfigs.append(
-                self._get_next_model_config(ensemble_submodel, model_index))
+                self._get_next_model_config(ensemble_submodel,
+                                            dimension_values[model_index]))
             model_index = model_index + 1
 
         return (ensemble_subconfigs, model_index)
 
-    def _get_next_ensemble_param_combo(self, start_model_index: int,
-                                       end_model_index: int) -> dict:
+    def _get_next_ensemble_param_combo(
+            self, start_model_index: int, end_model_index: int,
+            dimension_values: Dict[int, Dict[str, Union[int, float]]]) -> dict:
         """
         For the ensemble model the only parameter we need to set 
         is the max batch size; which will be the minimum batch size 
@@ -343,12 +384,9 @@ def _get_next_ensemble_param_combo(self, start_model_index: int,
         """
         min_val_of_max_batch_size = maxsize
         for model_index in range(start_model_index, end_model_index):
-            dimension_values = self._get_coordinate_values(
-                self._coordinate_to_measure, model_index)
-
             min_val_of_max_batch_size = int(
                 min([
-                    dimension_values.get("max_batch_size", 1),
+                    dimension_values[model_index].get("max_batch_size", 1),
                     min_val_of_max_batch_size
                 ]))
 
@@ -367,11 +405,27 @@ def _get_next_ensemble_model_config(self, model: ModelProfileSpec,
 
         return model_config
 
-    def _get_next_model_config(self, model: ModelProfileSpec,
-                               dimension_index: int) -> ModelConfig:
-        dimension_values = self._get_coordinate_values(
-            self._coordinate_to_measure, dimension_index)
+    def _get_search_bounds_set_by_config(self) -> Dict[str, bool]:
+        search_bounds = [
+            'run_config_search_min_model_batch_size',
+            'run_config_search_max_model_batch_size',
+            'run_config_search_min_instance_count',
+            'run_config_search_max_instance_count',
+            'run_config_search_min_concurrency',
+            'run_config_search_max_concurrency'
+        ]
+
+        config_fields = self._config.get_config()
+        return {
+            search_bound: config_fields[search_bound].is_set_by_config()
+            for search_bound in search_bounds
+        }
 
+    def _get_next_model_config(
+            self, model: ModelProfileSpec,
+            dimension_values: Dict[str, Union[int, float]]) -> ModelConfig:
+        # The param_combo is built fresh for every config, since
+        # make_model_config places its values into the new model config
         kind = "KIND_CPU" if model.cpu_only() else "KIND_GPU"
         instance_count = self._calculate_instance_count(dimension_values)
 
@@ -395,34 +449,55 @@ def _get_next_model_config(self, model: ModelProfileSpec,
             model_variant_name_manager=self._model_variant_name_manager)
         return model_config
 
-    def _get_next_perf_analyzer_config(self, model_variant_name: str,
-                                       model: ModelProfileSpec,
-                                       model_index: int) -> PerfAnalyzerConfig:
-        dimension_values = self._get_coordinate_values(
-            self._coordinate_to_measure, model_index)
-
-        perf_analyzer_config = PerfAnalyzerConfig()
-
-        perf_analyzer_config.update_config_from_profile_config(
-            model_variant_name, self._config)
+    def _get_next_perf_analyzer_config(
+            self, model_variant_name: str, model: ModelProfileSpec,
+            dimension_values: Dict[str, Union[int,
+                                              float]]) -> PerfAnalyzerConfig:
+        perf_analyzer_config = copy(
+            self._get_perf_analyzer_config_template(model))
 
         concurrency = self._calculate_concurrency(dimension_values)
 
-        perf_config_params = {'batch-size': 1, 'concurrency-range': concurrency}
+        perf_config_params = {
+            'model-name': model_variant_name,
+            'latency-report-file': model_variant_name + "-results.csv",
+            'concurrency-range': concurrency
+        }
         perf_analyzer_config.update_config(perf_config_params)
 
+        # The user's flags take priority over the values set for this step
         perf_analyzer_config.update_config(model.perf_analyzer_flags())
         return perf_analyzer_config
 
+    def _get_perf_analyzer_config_template(
+            self, model: ModelProfileSpec) -> PerfAnalyzerConfig:
+        """
+        Returns the PerfAnalyzerConfig values that are the same for
+        every step of this model. It must be copied before being updated
+        """
+        model_name = model.model_name()
+        if model_name not in self._perf_analyzer_config_templates:
+            perf_analyzer_config = PerfAnalyzerConfig()
+
+            perf_analyzer_config.update_config_from_profile_config(
+                model_name, self._config)
+            perf_analyzer_config.update_config({'batch-size': 1})
+            perf_analyzer_config.update_config(model.perf_analyzer_flags())
+
+            self._perf_analyzer_config_templates[
+                model_name] = perf_analyzer_config
+
+        return self._perf_analyzer_config_templates[model_name]
+
     def _calculate_model_batch_size(
             self, dimension_values: Dict[str, Union[int, float]]) -> int:
         batch_size = int(dimension_values.get("max_batch_size", 1))
 
-        min_batch_size_is_set_by_config = self._config.get_config(
-        )['run_config_search_min_model_batch_size'].is_set_by_config()
+        min_batch_size_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_min_model_batch_size']
 
-        max_batch_size_is_set_by_config = self._config.get_config(
-        )['run_config_search_max_model_batch_size'].is_set_by_config()
+        max_batch_size_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_max_model_batch_size']
 
         if min_batch_size_is_set_by_config and batch_size < self._config.run_config_search_min_model_batch_size:
             return self._config.run_config_search_min_model_batch_size
@@ -436,11 +511,11 @@ def _calculate_instance_count(
             self, dimension_values: Dict[str, Union[int, float]]) -> int:
         instance_count = int(dimension_values.get("instance_count", 1))
 
-        min_instance_count_is_set_by_config = self._config.get_config(
-        )['run_config_search_min_instance_count'].is_set_by_config()
+        min_instance_count_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_min_instance_count']
 
-        max_instance_count_is_set_by_config = self._config.get_config(
-        )['run_config_search_max_instance_count'].is_set_by_config()
+        max_instance_count_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_max_instance_count']
 
         if min_instance_count_is_set_by_config and instance_count < self._config.run_config_search_min_instance_count:
             return self._config.run_config_search_min_instance_count
@@ -456,11 +531,11 @@ def _calculate_concurrency(
         instance_count = self._calculate_instance_count(dimension_values)
         concurrency = 2 * model_batch_size * instance_count
 
-        min_concurrency_is_set_by_config = self._config.get_config(
-        )['run_config_search_min_concurrency'].is_set_by_config()
+        min_concurrency_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_min_concurrency']
 
-        max_concurrency_is_set_by_config = self._config.get_config(
-        )['run_config_search_max_concurrency'].is_set_by_config()
+        max_concurrency_is_set_by_config = self._search_bounds_set_by_config[
+            'run_config_search_max_concurrency']
 
         if min_concurrency_is_set_by_config and concurrency < self._config.run_config_search_min_concurrency:
             return self._config.run_config_search_min_concurrency
@@ -471,17 +546,18 @@ def _calculate_concurrency(
         return concurrency
 
     def _create_default_run_config(self) -> RunConfig:
-        default_run_config = RunConfig(self._triton_env)
+        default_model_run_configs = []
 
         for model in self._models:
             if model.model_name() in self._ensemble_submodels:
-                default_run_config.add_model_run_config(
+                default_model_run_configs.append(
                     self._create_default_ensemble_model_run_config(model))
             else:
-                default_run_config.add_model_run_config(
+                default_model_run_configs.append(
                     self._create_default_model_run_config(model))
 
-        return default_run_config
+        return RunConfig.from_model_run_configs(self._triton_env,
+                                                default_model_run_configs)
 
     def _create_default_ensemble_model_run_config(
             self, model: ModelProfileSpec) -> ModelRunConfig:
@@ -105,6 +105,25 @@ def ensemble_subconfigs(self):
         """
         return self._model_run_configs[0].ensemble_subconfigs()
 
+    @classmethod
+    def from_model_run_configs(cls, triton_env, model_run_configs):
+        """
+        Creates a RunConfig from a list of ModelRunConfigs
+        in a single step
+
+        Parameters
+        ----------
+        triton_env : dict
+            A dictionary of environment variables to set
+            when launching tritonserver
+        model_run_configs : list of ModelRunConfig
+            The ModelRunConfigs to run concurrently
+        """
+        run_config = RunConfig(triton_env)
+        run_config._model_run_configs = list(model_run_configs)
+
+        return run_config
+
     @classmethod
     def from_dict(cls, run_config_dict):
         run_config = RunConfig({})
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import copy
+
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
 from model_analyzer.config.input.config_defaults import DEFAULT_MEASUREMENT_MODE
@@ -404,6 +406,19 @@ def __setitem__(self, key, value):
                 f"The argument '{key}' to the perf_analyzer "
                 "is not supported by the model analyzer.")
 
+    def __copy__(self):
+        """
+        Returns a copy of this config that can be updated
+        without changing this one. The argument values are
+        replaced rather than mutated, so only the dicts
+        holding them need to be copied
+        """
+
+        perf_config = PerfAnalyzerConfig.__new__(PerfAnalyzerConfig)
+        for key, value in self.__dict__.items():
+            setattr(perf_config, key, copy(value))
+        return perf_config
+
     def __contains__(self, key):
         """
         Returns
@@ -12,13 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 import argparse
 import yaml
 import sys
+import mmap
 import os
 import re
 
+PROFILING_RE = re.compile(rb'Profiling (\S+)')
+
+INFERENCE_TABLE_TOKEN = b'Models (Inference):'
+GPU_TABLE_TOKEN = b'Models (GPU Metrics):'
+LOG_TOKEN_RE = re.compile(rb'Profiling (\S+)'
+                          rb'|Received SIGINT maximum number of times'
+                          rb'|Stopped Triton Server\.'
+                          rb'|Models \(Inference\):'
+                          rb'|Models \(GPU Metrics\):')
+TABLE_FIRST_COLUMN_RE = re.compile(r'\S+')
+
 
 class TestOutputValidator:
     """
@@ -31,6 +44,7 @@ def __init__(self, config, test_name, checkpoint_dir, analyzer_log):
         self._profile_models = list(config['profile_models'])
         self._analyzer_log = analyzer_log
         self._checkpoint_dir = checkpoint_dir
+        self._log_scan = None
 
         check_function = self.__getattribute__(f'check_{test_name}')
 
@@ -39,14 +53,82 @@ def __init__(self, config, test_name, checkpoint_dir, analyzer_log):
         else:
             sys.exit(1)
 
+    @contextmanager
+    def _map_log(self):
+        """
+        Memory maps the analyzer log, so that it can be
+        searched without copying it into a string first
+        """
+
+        with open(self._analyzer_log, 'rb') as f:
+            # An empty file can't be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b''
+            else:
+                with mmap.mmap(f.fileno(), 0,
+                               access=mmap.ACCESS_READ) as log_map:
+                    yield log_map
+
+    def _scan_log(self):
+        """
+        Searches the analyzer log in a single pass and collects
+        the token counts, the profiled model names and the
+        contents of the inference table. The result is cached
+        so that checks can share one pass over the log
+        """
+
+        if self._log_scan is not None:
+            return self._log_scan
+
+        token_counts = defaultdict(int)
+        profiled_models = []
+        inference_table_start = None
+        inference_table_end = None
+
+        with self._map_log() as log_map:
+            for match in LOG_TOKEN_RE.finditer(log_map):
+                token = match.group(0)
+                if match.group(1) is not None:
+                    profiled_models.append(match.group(1).decode())
+                elif token == INFERENCE_TABLE_TOKEN:
+                    if inference_table_start is None:
+                        inference_table_start = match.end()
+                elif token == GPU_TABLE_TOKEN:
+                    if inference_table_start is not None and inference_table_end is None:
+                        inference_table_end = match.start()
+                else:
+                    token_counts[token.decode()] += 1
+
+            inference_table = b''
+            if inference_table_start is not None:
+                inference_table = log_map[
+                    inference_table_start:inference_table_end]
+
+        self._log_scan = {
+            'token_counts': token_counts,
+            'profiled_models': profiled_models,
+            'inference_table': inference_table.decode().strip()
+        }
+        return self._log_scan
+
+    def _count_checkpoint_files(self):
+        """
+        Counts the checkpoint files in the checkpoint
+        directory, ignoring hidden and partially written files
+        """
+
+        with os.scandir(self._checkpoint_dir) as entries:
+            return sum(1 for entry in entries
+                       if entry.is_file() and not entry.name.startswith('.') and
+                       entry.name.endswith('.ckpt'))
+
     def check_num_checkpoints(self):
         """
         Open the checkpoints directory and 
         check that there is 3 checkpoints
         """
 
-        checkpoint_files = os.listdir(self._checkpoint_dir)
-        return len(checkpoint_files) == len(self._profile_models)
+        return self._count_checkpoint_files() == len(self._profile_models)
 
     def check_loading_checkpoints(self):
         """
@@ -54,14 +136,11 @@ def check_loading_checkpoints(self):
         analyzer runs took place
         """
 
-        with open(self._analyzer_log, 'r') as f:
-            log_contents = f.read()
-
-        matches = re.findall('Profiling (\S+)', log_contents)
-        for match in matches:
-            # "Profiling server only metrics" is ok. No other "Profiling" lines should exist
-            if match != "server":
-                return False
+        with self._map_log() as log_map:
+            for match in PROFILING_RE.finditer(log_map):
+                # "Profiling server only metrics" is ok. No other "Profiling" lines should exist
+                if match.group(1) != b"server":
+                    return False
         return True
 
     def check_interrupt_handling(self):
@@ -73,28 +152,17 @@ def check_interrupt_handling(self):
         been run once
         """
 
-        checkpoint_files = os.listdir(self._checkpoint_dir)
-        if len(checkpoint_files) != 2:
+        if self._count_checkpoint_files() != 2:
             return False
 
-        with open(self._analyzer_log, 'r') as f:
-            log_contents = f.read()
-
         # check for SIGINT
-        token = "SIGINT"
-        if log_contents.find(token) == -1:
-            return False
+        with self._map_log() as log_map:
+            if log_map.find(b"SIGINT") == -1:
+                return False
 
         # check that 2nd model is profiled once
-        token = f"Profiling {self._profile_models[1]}"
-        token_idx = 0
-        found_count = 0
-        while True:
-            token_idx = log_contents.find(token, token_idx + 1)
-            if token_idx == -1:
-                break
-            found_count += 1
-
+        found_count = sum(1 for match in self._scan_log()['profiled_models']
+                          if match.startswith(self._profile_models[1]))
         return found_count == 1
 
     def check_early_exit(self):
@@ -103,16 +171,18 @@ def check_early_exit(self):
         and that Triton server was stopped twice
         """
 
-        with open(self._analyzer_log, 'r') as f:
-            log_contents = f.read()
+        log_scan = self._scan_log()
+        token_counts = log_scan['token_counts']
+        profiled_model_count = sum(1 for match in log_scan['profiled_models']
+                                   if match.startswith('model'))
 
-        if log_contents.find("Received SIGINT maximum number of times") == -1:
+        if token_counts['Received SIGINT maximum number of times'] == 0:
             print("\n***\n***  Early exit not triggered. \n***")
             return False
-        elif log_contents.count("Profiling model") > 1:
+        elif profiled_model_count > 1:
             print("\n***\n***  Early exit not triggered on time. \n***")
             return False
-        elif log_contents.count("Stopped Triton Server.") < 2:
+        elif token_counts['Stopped Triton Server.'] < 2:
             return False
         return True
 
@@ -125,12 +195,9 @@ def check_continue_after_checkpoint(self,
         """
 
         profiled_models = self._profile_models[-2:]
-        with open(self._analyzer_log, 'r') as f:
-            log_contents = f.read()
 
         found_models_count = defaultdict(int)
-        matches = re.findall('Profiling (\S+)', log_contents)
-        for match in matches:
+        for match in self._scan_log()['profiled_models']:
             base_model_name = match.rsplit('_', 2)[0]
             found_models_count[base_model_name] += 1
 
@@ -170,25 +237,13 @@ def check_measurements_consistent_with_config(self):
             return False
 
         profiled_models = self._profile_models[-2:]
-        with open(self._analyzer_log, 'r') as f:
-            log_contents = f.read()
-
-        # Find table title and offset by token length and single newline character
-        token = 'Models (Inference):'
-        inference_table_start = log_contents.find(token)
-        inference_table_start += len(token) + 1
-
-        # Find gpu table title
-        token = 'Models (GPU Metrics):'
-        inference_table_end = log_contents.find(token)
-
-        inference_table_contents = log_contents[
-            inference_table_start:inference_table_end].strip()
+        inference_table_contents = self._scan_log()['inference_table']
 
-        table_measurement_count = defaultdict(int)
-        for line in inference_table_contents.split('\n'):
-            model_name = line.split()[0]
-            table_measurement_count[model_name] += 1
+        # Only the first column (the model name) of each row is needed
+        table_rows = (TABLE_FIRST_COLUMN_RE.search(line)
+                      for line in inference_table_contents.split('\n'))
+        table_measurement_count = Counter(
+            row.group(0) for row in table_rows if row is not None)
 
         # resnet50 libtorch has 4 results:
         #   ([2 models, one of which is default] x [2 concurrencies])
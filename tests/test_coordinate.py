@@ -116,6 +116,41 @@ def test_enumerate(self):
         self.assertEqual(indexes, [0, 1, 2, 3])
         self.assertEqual(values, [2, 4, 1, 7])
 
+    def test_nested_iteration(self):
+        c1 = Coordinate([2, 4])
+
+        pairs = [(x, y) for x in c1 for y in c1]
+
+        self.assertEqual(pairs, [(2, 2), (2, 4), (4, 2), (4, 4)])
+
+    def test_key_and_hash(self):
+        c1 = Coordinate([2, 4, 1])
+        c2 = Coordinate([2, 4, 1])
+
+        self.assertEqual(c1.key(), (2, 4, 1))
+        self.assertEqual(hash(c1), hash(c2))
+        self.assertEqual(len({c1, c2}), 1)
+
+        # Confirm the key is updated after the coordinate changes
+        c1[2] = 3
+        self.assertEqual(c1.key(), (2, 4, 3))
+        self.assertNotEqual(hash(c1), hash(c2))
+
+        c3 = Coordinate([0.1, 4.6])
+        c3.round()
+        self.assertEqual(c3.key(), (0, 5))
+
+    def test_slots(self):
+        c1 = Coordinate([2, 4, 1])
+        self.assertFalse(hasattr(c1, '__dict__'))
+
+        # Confirm copies are independent of the original
+        c2 = deepcopy(c1)
+        c2[0] = 5
+        self.assertEqual(c1, Coordinate([2, 4, 1]))
+        self.assertEqual(c2, Coordinate([5, 4, 1]))
+        self.assertNotEqual(c1, c2)
+
     def test_stringification(self):
         c1 = Coordinate([2, 4, 1, 7])
         self.assertEqual("[2, 4, 1, 7]", c1.__str__())
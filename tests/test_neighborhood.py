@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from unittest.mock import MagicMock, patch
+from itertools import product
 
 from model_analyzer.config.generate.neighborhood import Neighborhood
 from model_analyzer.config.generate.search_config import NeighborhoodConfig
@@ -105,6 +106,27 @@ def test_create_neighborhood(self):
         expected_coordinates = [Coordinate(x) for x in expected_neighborhood]
         self.assertEqual(tuple(n._neighborhood), tuple(expected_coordinates))
 
+    def test_enumerate_all_values_in_bounds(self):
+        dims = SearchDimensions()
+        dims.add_dimensions(0, [
+            SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+            SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL)
+        ])
+
+        nc = NeighborhoodConfig(dims, radius=1, min_initialized=3)
+        n = Neighborhood(nc,
+                         home_coordinate=Coordinate([0, 0]),
+                         coordinate_data=CoordinateData())
+
+        bounds = [[1, 3], [4, 5]]
+        expected_values = [list(x) for x in product(range(1, 4), range(4, 6))]
+
+        self.assertEqual(
+            n._enumerate_all_values_in_bounds(bounds).tolist(), expected_values)
+
+        # With no dimensions there is a single, empty coordinate
+        self.assertEqual(n._enumerate_all_values_in_bounds([]).tolist(), [[]])
+
     def test_num_initialized(self):
         dims = SearchDimensions()
         dims.add_dimensions(0, [
@@ -15,6 +15,7 @@
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.device.gpu_device import GPUDevice
 import unittest
+from copy import copy
 from unittest.mock import MagicMock, patch, mock_open
 
 from model_analyzer.triton.model.model_config import ModelConfig
@@ -162,6 +163,21 @@ def test_perf_analyzer_additive_args(self):
         with self.assertRaises(TritonModelAnalyzerException):
             self.config.to_cli_string()
 
+    def test_perf_analyzer_config_copy(self):
+        """ Test that updating a copied config leaves the original unchanged """
+        config_copy = copy(self.config)
+        self.assertEqual(config_copy.to_cli_string(),
+                         self.config.to_cli_string())
+
+        config_copy['model-name'] = 'copied_model'
+        config_copy['shape'] = ['name1:1,2,3']
+        config_copy['verbose-csv'] = '--verbose-csv'
+
+        self.assertEqual(self.config['model-name'], 'test_model')
+        self.assertIsNone(self.config['shape'])
+        self.assertIsNone(self.config['verbose-csv'])
+        self.assertEqual(config_copy['model-name'], 'copied_model')
+
     def test_perf_analyzer_ssl_args(self):
         """
         Verify that the generated cli string passed to PA matches our expected output.
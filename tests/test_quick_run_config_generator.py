@@ -133,6 +133,60 @@ def test_get_starting_coordinate(self):
                                        ModelVariantNameManager())
         self.assertEqual(qrcg._get_starting_coordinate(), Coordinate([2, 1, 3]))
 
+    def test_recreate_neighborhood(self):
+        """
+        Test that recreating the neighborhood around a previously
+        visited home reuses the cached neighborhood, and that the
+        slow mode is reset for it
+        """
+        starting_neighborhood = self._qrcg._neighborhood
+
+        self._qrcg._home_coordinate = Coordinate([1, 1, 1])
+        self._qrcg._recreate_neighborhood(force_slow_mode=True)
+        self.assertIsNot(self._qrcg._neighborhood, starting_neighborhood)
+        self.assertTrue(self._qrcg._neighborhood._force_slow_mode)
+
+        self._qrcg._home_coordinate = Coordinate([0, 0, 0])
+        self._qrcg._recreate_neighborhood(force_slow_mode=False)
+        self.assertIs(self._qrcg._neighborhood, starting_neighborhood)
+        self.assertFalse(self._qrcg._neighborhood._force_slow_mode)
+
+        self._qrcg._home_coordinate = Coordinate([1, 1, 1])
+        self._qrcg._recreate_neighborhood(force_slow_mode=False)
+        self.assertFalse(self._qrcg._neighborhood._force_slow_mode)
+        self.assertEqual(
+            self._qrcg._coordinate_data.get_visit_count(Coordinate([1, 1, 1])),
+            2)
+
+    def test_take_step_when_done(self):
+        """
+        Test that when the new home means the generator is done,
+        no new neighborhood is created and the home is not visited again
+        """
+        home = self._qrcg._home_coordinate
+        starting_neighborhood = self._qrcg._neighborhood
+
+        # Stepping to the current home is done
+        self._qrcg._neighborhood.determine_new_home = MagicMock(
+            return_value=Coordinate(home))
+        self._qrcg._take_step()
+        self.assertTrue(self._qrcg._is_done())
+        self.assertIs(self._qrcg._neighborhood, starting_neighborhood)
+        self.assertEqual(self._qrcg._coordinate_data.get_visit_count(home), 0)
+
+        # Stepping to a coordinate that was already visited twice is done
+        self._qrcg._done = False
+        new_home = Coordinate([1, 0, 0])
+        self._qrcg._coordinate_data.increment_visit_count(new_home)
+        self._qrcg._coordinate_data.increment_visit_count(new_home)
+        self._qrcg._neighborhood.determine_new_home = MagicMock(
+            return_value=new_home)
+        self._qrcg._take_step()
+        self.assertTrue(self._qrcg._is_done())
+        self.assertEqual(self._qrcg._home_coordinate, home)
+        self.assertEqual(
+            self._qrcg._coordinate_data.get_visit_count(new_home), 2)
+
     def test_get_next_run_config(self):
         """
         Test that get_next_run_config() creates a proper RunConfig
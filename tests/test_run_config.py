@@ -55,6 +55,23 @@ def test_model_run_configs(self):
         self.assertEqual(mrc_out[0], mrc1)
         self.assertEqual(mrc_out[1], mrc2)
 
+    def test_from_model_run_configs(self):
+        """
+        Test creating a RunConfig from a list of ModelRunConfigs
+        """
+        fake_env = {'a': 5}
+        mrc1 = ModelRunConfig("model1", MagicMock(), MagicMock())
+        mrc2 = ModelRunConfig("model2", MagicMock(), MagicMock())
+        mrcs = [mrc1, mrc2]
+        rc = RunConfig.from_model_run_configs(fake_env, mrcs)
+
+        self.assertEqual(rc.triton_environment(), fake_env)
+        self.assertEqual(rc.model_run_configs(), [mrc1, mrc2])
+
+        # Confirm the RunConfig does not share the input list
+        mrcs.pop()
+        self.assertEqual(len(rc.model_run_configs()), 2)
+
     def test_representation(self):
         """
         Test that representation() is just a string join of member ModelRunConfig's representations
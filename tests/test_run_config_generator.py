@@ -111,6 +111,41 @@ def test_two_models(self):
             self.assertEqual(mock_method.call_count,
                              expected_num_calls_to_set_last_results)
 
+    def test_default_configs_not_repeated(self):
+        """
+        Test that the combinations of default configs are only generated
+        in the default step, and are not repeated in the non-default step
+
+        Same setup as test_two_models: the first 4 RunConfigs are the
+        default step, and none of the remaining 64 contain only defaults
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_model_batch_size: 2
+            run_config_search_max_instance_count: 2
+            run_config_search_max_concurrency: 2
+            profile_models:
+                - my-model
+                - my-modelB
+
+            """)
+        # yapf: enable
+
+        run_configs = self._run_and_test_run_config_generator(
+            yaml_str, expected_config_count=68)
+
+        representations = [rc.representation() for rc in run_configs]
+        self.assertEqual(len(set(representations)), len(representations))
+
+        default_only = [
+            all(
+                mrc.model_variant_name().endswith('_config_default')
+                for mrc in rc.model_run_configs())
+            for rc in run_configs
+        ]
+        self.assertEqual(default_only, [True] * 4 + [False] * 64)
+
     def test_two_uneven_models(self):
         """
         Test Two Uneven Models: